@@ -1,37 +1,49 @@
-"""Smol Claw — Multi-Agent Marketing System package."""
-
-from src.config import CONFIG, MODEL_ALIASES, DEFAULT_MODEL, DISCORD_CHANNELS, DISCORD_TOKENS
-from src.infrastructure.context import ContextCollector
-from src.infrastructure.usage import UsageLimitExceeded, UsageTracker
-from src.infrastructure.memory import SimpleMemory, GuardrailMemory
-from src.domain.persona import BOT_PERSONA
-from src.adapters.sns.x import XClient, XPostResult
-from src.adapters.sns.threads import ThreadsClient, ThreadsPostResult
-from src.adapters.sns.linkedin import LinkedInClient, LinkedInPostResult
-from src.adapters.sns.instagram import InstagramClient, InstagramPostResult
-from src.adapters.sns.news import NewsClient, NewsItem, NewsSearchResult
-
-__all__ = [
-    "CONFIG",
-    "MODEL_ALIASES",
-    "DEFAULT_MODEL",
-    "DISCORD_CHANNELS",
-    "DISCORD_TOKENS",
-    "ContextCollector",
-    "UsageLimitExceeded",
-    "UsageTracker",
-    "SimpleMemory",
-    "GuardrailMemory",
-    "BOT_PERSONA",
-    "XClient",
-    "XPostResult",
-    "ThreadsClient",
-    "ThreadsPostResult",
-    "LinkedInClient",
-    "LinkedInPostResult",
-    "InstagramClient",
-    "InstagramPostResult",
-    "NewsClient",
-    "NewsItem",
-    "NewsSearchResult",
-]
+"""Smol Claw — Multi-Agent Marketing System package.
+
+Submodule attributes are imported lazily (PEP 562) so that `import src`
+does not pull in the whole adapter graph — tweepy, aiohttp and friends
+load only when the corresponding name is actually used.
+"""
+
+_LAZY_ATTRS = {
+    "CONFIG": "src.config",
+    "MODEL_ALIASES": "src.config",
+    "DEFAULT_MODEL": "src.config",
+    "DISCORD_CHANNELS": "src.config",
+    "DISCORD_TOKENS": "src.config",
+    "ContextCollector": "src.infrastructure.context",
+    "UsageLimitExceeded": "src.infrastructure.usage",
+    "UsageTracker": "src.infrastructure.usage",
+    "SimpleMemory": "src.infrastructure.memory",
+    "GuardrailMemory": "src.infrastructure.memory",
+    "BOT_PERSONA": "src.domain.persona",
+    "XClient": "src.adapters.sns.x",
+    "XPostResult": "src.adapters.sns.x",
+    "ThreadsClient": "src.adapters.sns.threads",
+    "ThreadsPostResult": "src.adapters.sns.threads",
+    "LinkedInClient": "src.adapters.sns.linkedin",
+    "LinkedInPostResult": "src.adapters.sns.linkedin",
+    "InstagramClient": "src.adapters.sns.instagram",
+    "InstagramPostResult": "src.adapters.sns.instagram",
+    "NewsClient": "src.adapters.sns.news",
+    "NewsItem": "src.adapters.sns.news",
+    "NewsSearchResult": "src.adapters.sns.news",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    try:
+        module_path = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,7 +8,9 @@ the primary class used by existing code. This adapter demonstrates how the
 full hexagonal split will work.
 """
 
+import re
 import sys
+from typing import Optional
 
 import discord
 
@@ -29,10 +31,9 @@ class DiscordNotificationAdapter:
     async def send(self, channel_id: int, text: str) -> None:
         channel = self._client.get_channel(channel_id)
         if channel:
-            # Split long messages
-            while text:
-                await channel.send(text[:2000])
-                text = text[2000:]
+            # Split long messages without re-copying the remainder each pass
+            for i in range(0, len(text), 2000):
+                await channel.send(text[i:i + 2000])
 
     async def send_typing(self, channel_id: int) -> None:
         channel = self._client.get_channel(channel_id)
@@ -52,6 +53,9 @@ class DiscordBotAdapter(discord.Client):
         super().__init__(intents=intents, **discord_kwargs)
         self._brain = brain
         self._token = token
+        # Lowercased mention matchers, built lazily once the gateway user is known
+        self._lc_role_names: Optional[frozenset] = None
+        self._mention_re: Optional[re.Pattern] = None
 
     def _to_incoming(self, message: discord.Message) -> IncomingMessage:
         """Convert a Discord message to platform-agnostic IncomingMessage."""
@@ -74,18 +78,25 @@ class DiscordBotAdapter(discord.Client):
     def _is_role_mentioned(self, message: discord.Message) -> bool:
         if not message.role_mentions or not self.user:
             return False
-        bot_names = {self._brain.bot_name.lower()} | {a.lower() for a in self._brain._aliases}
-        return any(role.name.lower() in bot_names for role in message.role_mentions)
+        if self._lc_role_names is None:
+            self._lc_role_names = frozenset(
+                {self._brain.bot_name.lower()} | {a.lower() for a in self._brain._aliases}
+            )
+        return any(role.name.lower() in self._lc_role_names for role in message.role_mentions)
 
     def _is_text_mentioned(self, content: str) -> bool:
         if not self.user:
             return False
-        names = {self._brain.bot_name, self.user.name}
-        if self.user.display_name:
-            names.add(self.user.display_name)
-        names.update(self._brain._aliases)
-        content_lower = content.lower()
-        return any(f"@{name.lower()}" in content_lower for name in names)
+        if self._mention_re is None:
+            names = {self._brain.bot_name, self.user.name}
+            if self.user.display_name:
+                names.add(self.user.display_name)
+            names.update(self._brain._aliases)
+            # One alternation = one scan of the content, however many aliases
+            self._mention_re = re.compile(
+                "|".join(re.escape(f"@{name.lower()}") for name in names)
+            )
+        return self._mention_re.search(content.lower()) is not None
 
     async def on_ready(self):
         _log(f"[{self._brain.bot_name}] logged in as {self.user}")
@@ -94,6 +105,11 @@ class DiscordBotAdapter(discord.Client):
         self._brain.wire(notification, self.get_channel, self.is_closed)
         await self._brain.start_alarm_loop()
 
+    async def close(self):
+        """Flush pending alarm writes before disconnecting."""
+        self._brain._alarm_scheduler.flush()
+        await super().close()
+
     async def on_message(self, message: discord.Message):
         """Convert Discord message and delegate to AgentBrain."""
         # Ignore own messages
@@ -69,6 +69,7 @@ class BaseMarketingBot(discord.Client):
         self._clients: Dict[str, Any] = clients or {}
         self._action_lock = asyncio.Lock()
         self._channel_history: OrderedDict[int, List[Dict[str, str]]] = OrderedDict()
+        self._history_msg_count = 0  # running total across channels
         self._max_history = 10
         self._current_model: str = DEFAULT_MODEL
         self._active: bool = True
@@ -81,14 +82,21 @@ class BaseMarketingBot(discord.Client):
         self._alarm_loop_task: Optional[asyncio.Task] = None
         self._alarm_fire_tasks: set = set()  # track in-flight alarm tasks for cleanup
         self._in_flight_alarms: set = set()  # alarm IDs currently executing (prevent duplicate fire)
+        # Lowercased mention matchers, built lazily once the gateway user is known
+        self._lc_role_names: Optional[frozenset] = None
+        self._mention_re: Optional[re.Pattern] = None
 
     def _is_role_mentioned(self, message: discord.Message) -> bool:
         """Check if the bot's role is mentioned (Discord converts @BotName to role mention)."""
         if not message.role_mentions or not self.user:
             return False
+        if self._lc_role_names is None:
+            self._lc_role_names = frozenset(
+                {self.bot_name.lower()} | {a.lower() for a in self._aliases}
+            )
         # Bot's own roles in guilds it belongs to
         for role in message.role_mentions:
-            if role.name.lower() in {self.bot_name.lower()} | {a.lower() for a in self._aliases}:
+            if role.name.lower() in self._lc_role_names:
                 return True
         return False
 
@@ -96,21 +104,31 @@ class BaseMarketingBot(discord.Client):
         """Check if bot is mentioned by @name in plain text (LLM-generated mentions)."""
         if not self.user:
             return False
-        names = {self.bot_name, self.user.name}
-        if self.user.display_name:
-            names.add(self.user.display_name)
-        names.update(self._aliases)
-        content_lower = content.lower()
-        return any(f"@{name.lower()}" in content_lower for name in names)
+        if self._mention_re is None:
+            names = {self.bot_name, self.user.name}
+            if self.user.display_name:
+                names.add(self.user.display_name)
+            names.update(self._aliases)
+            # One alternation = one scan of the content, however many aliases
+            self._mention_re = re.compile(
+                "|".join(re.escape(f"@{name.lower()}") for name in names)
+            )
+        return self._mention_re.search(content.lower()) is not None
 
     async def on_ready(self):
         _log(f"[{self.bot_name}] logged in as {self.user}")
         if not self._alarm_loop_task or self._alarm_loop_task.done():
             self._alarm_loop_task = asyncio.create_task(self._alarm_loop())
 
+    async def close(self):
+        """Flush pending alarm writes before disconnecting."""
+        self._alarm_scheduler.flush()
+        await super().close()
+
     def clear_history(self):
         """대화 히스토리 전체 초기화."""
         self._channel_history.clear()
+        self._history_msg_count = 0
         _log(f"[{self.bot_name}] conversation history cleared")
 
     # -- Public properties for HR / domain access --
@@ -132,8 +150,8 @@ class BaseMarketingBot(discord.Client):
         self._rehired = value
 
     def history_message_count(self) -> int:
-        """Total message count across all channels."""
-        return sum(len(h) for h in self._channel_history.values())
+        """Total message count across all channels (O(1) running counter)."""
+        return self._history_msg_count
 
     def cancel_own_tasks(self) -> int:
         """Cancel all active tasks. Public alias for _cancel_own_tasks."""
@@ -256,7 +274,8 @@ class BaseMarketingBot(discord.Client):
                 self._channel_history[channel_id] = []
                 # Evict oldest channel if over capacity
                 while len(self._channel_history) > self._MAX_CHANNELS:
-                    evicted_id, _ = self._channel_history.popitem(last=False)
+                    evicted_id, evicted = self._channel_history.popitem(last=False)
+                    self._history_msg_count -= len(evicted)
                     _log(f"[{self.bot_name}] evicted channel history: {evicted_id}")
             history = self._channel_history[channel_id]
 
@@ -316,7 +335,9 @@ class BaseMarketingBot(discord.Client):
             # Save to history
             history.append({"role": "user", "text": user_message})
             history.append({"role": "assistant", "text": response[:200]})
+            self._history_msg_count += 2
             if len(history) > self._max_history * 2:
+                self._history_msg_count -= len(history) - self._max_history * 2
                 self._channel_history[channel_id] = history[-self._max_history * 2:]
 
             # If cancel happened during LLM execution, suppress bot-triggered response
@@ -517,10 +538,12 @@ class BaseMarketingBot(discord.Client):
         args = message.content.strip().split()
         if len(args) >= 2 and args[1].lower() == "all":
             self._channel_history.clear()
+            self._history_msg_count = 0
             await message.channel.send(f"[{self.bot_name}] 전체 대화 기록 초기화됨.")
         else:
             channel_id = message.channel.id
             if channel_id in self._channel_history:
+                self._history_msg_count -= len(self._channel_history[channel_id])
                 del self._channel_history[channel_id]
             await message.channel.send(f"[{self.bot_name}] 이 채널 대화 기록 초기화됨.")
 
@@ -529,9 +552,11 @@ class BaseMarketingBot(discord.Client):
         args = message.content.strip().split()
         if len(args) >= 2 and args[1].lower() == "all":
             self._channel_history.clear()
+            self._history_msg_count = 0
         else:
             channel_id = message.channel.id
             if channel_id in self._channel_history:
+                self._history_msg_count -= len(self._channel_history[channel_id])
                 del self._channel_history[channel_id]
 
     async def _handle_help(self, message: discord.Message):
@@ -721,8 +746,4 @@ class BaseMarketingBot(discord.Client):
         """Split a message into chunks that fit Discord's character limit."""
         if len(text) <= limit:
             return [text]
-        chunks = []
-        while text:
-            chunks.append(text[:limit])
-            text = text[limit:]
-        return chunks
+        return [text[i:i + limit] for i in range(0, len(text), limit)]
@@ -29,10 +29,25 @@ class InstagramClient:
     Instagram requires an image for every post.
     """
 
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
     @property
     def is_configured(self) -> bool:
         return bool(CONFIG["instagram_user_id"] and CONFIG["instagram_access_token"])
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared session; call on shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @staticmethod
     def truncate_text(text: str, limit: int = 2200) -> str:
         """Instagram caption limit is ~2200 characters."""
@@ -55,17 +70,17 @@ class InstagramClient:
             "access_token": token,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, params=params) as resp:
-                if resp.status == 429:
-                    raise RateLimitError("Instagram API rate limited (429)")
-                if resp.status >= 400:
-                    body = await resp.text()
-                    raise RuntimeError(f"Instagram API failed (HTTP {resp.status}): {body}")
-                data = await resp.json()
-                if "id" not in data:
-                    raise RuntimeError(data.get("error", {}).get("message", str(data)))
-                return data["id"]
+        session = await self._get_session()
+        async with session.post(url, params=params) as resp:
+            if resp.status == 429:
+                raise RateLimitError("Instagram API rate limited (429)")
+            if resp.status >= 400:
+                body = await resp.text()
+                raise RuntimeError(f"Instagram API failed (HTTP {resp.status}): {body}")
+            data = await resp.json()
+            if "id" not in data:
+                raise RuntimeError(data.get("error", {}).get("message", str(data)))
+            return data["id"]
 
     async def _publish(self, container_id: str) -> str:
         """Publish a media container."""
@@ -76,17 +91,17 @@ class InstagramClient:
             "creation_id": container_id,
             "access_token": token,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, params=params) as resp:
-                if resp.status == 429:
-                    raise RateLimitError("Instagram API rate limited (429)")
-                if resp.status >= 400:
-                    body = await resp.text()
-                    raise RuntimeError(f"Instagram API failed (HTTP {resp.status}): {body}")
-                data = await resp.json()
-                if "id" not in data:
-                    raise RuntimeError(data.get("error", {}).get("message", str(data)))
-                return data["id"]
+        session = await self._get_session()
+        async with session.post(url, params=params) as resp:
+            if resp.status == 429:
+                raise RateLimitError("Instagram API rate limited (429)")
+            if resp.status >= 400:
+                body = await resp.text()
+                raise RuntimeError(f"Instagram API failed (HTTP {resp.status}): {body}")
+            data = await resp.json()
+            if "id" not in data:
+                raise RuntimeError(data.get("error", {}).get("message", str(data)))
+            return data["id"]
 
     async def post(self, text: str, image_url: str, _max_retries: int = 3) -> InstagramPostResult:
         """Post an image with caption to Instagram (with exponential backoff on 429).
@@ -22,10 +22,25 @@ class LinkedInPostResult:
 class LinkedInClient:
     """Async LinkedIn API client for posting text content."""
 
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
     @property
     def is_configured(self) -> bool:
         return bool(CONFIG["linkedin_access_token"])
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared session; call on shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @staticmethod
     def truncate_text(text: str, limit: int = 3000) -> str:
         if len(text) <= limit:
@@ -53,47 +68,47 @@ class LinkedInClient:
 
         for attempt in range(_max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    author_urn = await self._get_user_urn(session)
-
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "Content-Type": "application/json",
-                        "X-Restli-Protocol-Version": "2.0.0",
-                    }
-
-                    payload = {
-                        "author": author_urn,
-                        "lifecycleState": "PUBLISHED",
-                        "specificContent": {
-                            "com.linkedin.ugc.ShareContent": {
-                                "shareCommentary": {"text": text},
-                                "shareMediaCategory": "NONE",
-                            }
-                        },
-                        "visibility": {
-                            "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-                        },
-                    }
-
-                    async with session.post(
-                        f"{LINKEDIN_API_BASE}/ugcPosts",
-                        headers=headers,
-                        json=payload,
-                    ) as resp:
-                        if resp.status == 429:
-                            wait = 2 ** attempt
-                            await asyncio.sleep(wait)
-                            continue
-                        if resp.status >= 400:
-                            body = await resp.text()
-                            return LinkedInPostResult(
-                                success=False, text=text,
-                                error=f"HTTP {resp.status}: {body}",
-                            )
-                        data = await resp.json()
-                        post_id = data.get("id", "")
-                        return LinkedInPostResult(success=True, post_id=post_id, text=text)
+                session = await self._get_session()
+                author_urn = await self._get_user_urn(session)
+
+                headers = {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                    "X-Restli-Protocol-Version": "2.0.0",
+                }
+
+                payload = {
+                    "author": author_urn,
+                    "lifecycleState": "PUBLISHED",
+                    "specificContent": {
+                        "com.linkedin.ugc.ShareContent": {
+                            "shareCommentary": {"text": text},
+                            "shareMediaCategory": "NONE",
+                        }
+                    },
+                    "visibility": {
+                        "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+                    },
+                }
+
+                async with session.post(
+                    f"{LINKEDIN_API_BASE}/ugcPosts",
+                    headers=headers,
+                    json=payload,
+                ) as resp:
+                    if resp.status == 429:
+                        wait = 2 ** attempt
+                        await asyncio.sleep(wait)
+                        continue
+                    if resp.status >= 400:
+                        body = await resp.text()
+                        return LinkedInPostResult(
+                            success=False, text=text,
+                            error=f"HTTP {resp.status}: {body}",
+                        )
+                    data = await resp.json()
+                    post_id = data.get("id", "")
+                    return LinkedInPostResult(success=True, post_id=post_id, text=text)
 
             except Exception as e:
                 if attempt == _max_retries - 1:
@@ -42,10 +42,25 @@ _OPERATOR_PATTERN = re.compile(
 class NewsClient:
     """Search X (Twitter) for trending news and keyword monitoring."""
 
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
     @property
     def is_configured(self) -> bool:
         return bool(CONFIG["news_x_bearer_token"])
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared session; call on shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @staticmethod
     def _sanitize_keyword(keyword: str) -> str:
         """Whitelist-based sanitization: allow only safe characters."""
@@ -93,45 +108,45 @@ class NewsClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        X_SEARCH_API, headers=headers, params=params
-                    ) as resp:
-                        if resp.status == 429:
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(min(2 ** attempt, 30))
-                                continue
-                            return NewsSearchResult(success=False, error="Rate limited (429)")
-
-                        if resp.status >= 400:
-                            body = await resp.text()
-                            return NewsSearchResult(
-                                success=False, error=f"HTTP {resp.status}: {body}"
-                            )
-
-                        data = await resp.json()
-                        tweets = data.get("data", [])
-                        users = {}
-                        if "includes" in data and "users" in data["includes"]:
-                            for u in data["includes"]["users"]:
-                                users[u["id"]] = u.get("username", "")
-
-                        items = []
-                        for t in tweets:
-                            author_id = t.get("author_id", "")
-                            username = users.get(author_id, "")
-                            tweet_id = t.get("id", "")
-                            items.append(
-                                NewsItem(
-                                    text=t.get("text", ""),
-                                    author=username,
-                                    created_at=t.get("created_at", ""),
-                                    tweet_id=tweet_id,
-                                    url=f"https://x.com/{username}/status/{tweet_id}" if username else "",
-                                )
+                session = await self._get_session()
+                async with session.get(
+                    X_SEARCH_API, headers=headers, params=params
+                ) as resp:
+                    if resp.status == 429:
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(min(2 ** attempt, 30))
+                            continue
+                        return NewsSearchResult(success=False, error="Rate limited (429)")
+
+                    if resp.status >= 400:
+                        body = await resp.text()
+                        return NewsSearchResult(
+                            success=False, error=f"HTTP {resp.status}: {body}"
+                        )
+
+                    data = await resp.json()
+                    tweets = data.get("data", [])
+                    users = {}
+                    if "includes" in data and "users" in data["includes"]:
+                        for u in data["includes"]["users"]:
+                            users[u["id"]] = u.get("username", "")
+
+                    items = []
+                    for t in tweets:
+                        author_id = t.get("author_id", "")
+                        username = users.get(author_id, "")
+                        tweet_id = t.get("id", "")
+                        items.append(
+                            NewsItem(
+                                text=t.get("text", ""),
+                                author=username,
+                                created_at=t.get("created_at", ""),
+                                tweet_id=tweet_id,
+                                url=f"https://x.com/{username}/status/{tweet_id}" if username else "",
                             )
+                        )
 
-                        return NewsSearchResult(success=True, items=items)
+                    return NewsSearchResult(success=True, items=items)
 
             except Exception as e:
                 if attempt == max_retries - 1:
@@ -1,6 +1,7 @@
 """Threads (Meta) client using aiohttp."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 import aiohttp
@@ -21,10 +22,31 @@ class ThreadsPostResult:
 class ThreadsClient:
     """Async Threads API client (2-step: create container → publish)."""
 
-    @property
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @cached_property
     def is_configured(self) -> bool:
+        """Whether Threads credentials are set; config is fixed at startup,
+        so the check runs once per client instance."""
         return bool(CONFIG["threads_user_id"] and CONFIG["threads_access_token"])
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        Reusing one session keeps the TCP/TLS connection warm across the
+        container-create and publish calls (and across posts).
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared session; call on shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @staticmethod
     def truncate_text(text: str, limit: int = 500) -> str:
         if len(text) <= limit:
@@ -47,12 +69,12 @@ class ThreadsClient:
         if reply_to_id:
             params["reply_to_id"] = reply_to_id
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, params=params) as resp:
-                data = await resp.json()
-                if "id" not in data:
-                    raise RuntimeError(data.get("error", {}).get("message", str(data)))
-                return data["id"]
+        session = await self._get_session()
+        async with session.post(url, params=params) as resp:
+            data = await resp.json()
+            if "id" not in data:
+                raise RuntimeError(data.get("error", {}).get("message", str(data)))
+            return data["id"]
 
     async def _publish(self, container_id: str) -> str:
         user_id = CONFIG["threads_user_id"]
@@ -62,12 +84,12 @@ class ThreadsClient:
             "creation_id": container_id,
             "access_token": token,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, params=params) as resp:
-                data = await resp.json()
-                if "id" not in data:
-                    raise RuntimeError(data.get("error", {}).get("message", str(data)))
-                return data["id"]
+        session = await self._get_session()
+        async with session.post(url, params=params) as resp:
+            data = await resp.json()
+            if "id" not in data:
+                raise RuntimeError(data.get("error", {}).get("message", str(data)))
+            return data["id"]
 
     async def post(self, text: str) -> ThreadsPostResult:
         text = self.truncate_text(text)
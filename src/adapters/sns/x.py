@@ -2,6 +2,7 @@
 
 import asyncio
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 import tweepy
@@ -23,8 +24,10 @@ class XClient:
     def __init__(self):
         self._client: Optional[tweepy.Client] = None
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
+        """Whether all X credentials are set; config is fixed at startup,
+        so the check runs once per client instance."""
         keys = [
             CONFIG["x_consumer_key"],
             CONFIG["x_consumer_secret"],
@@ -14,13 +14,32 @@ import asyncio
 import json
 import os
 import uuid
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from src.config import CONFIG
 
+try:
+    import orjson
+except ImportError:  # optional — stdlib json works, orjson is just faster
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Parse one JSON log line with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_line(data: Dict[str, Any]) -> bytes:
+    """Serialize a record to one newline-terminated JSON line (UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
 
 MEMORY_DIR = Path("memory")
 MEMORY_DIR.mkdir(exist_ok=True)
@@ -32,6 +51,12 @@ _file_lock = asyncio.Lock()
 
 @dataclass
 class PostApproval:
+    """Record schema for the approval log.
+
+    In-memory records stay plain dicts (what the log lines and the HTTP
+    layer use); construct this only where a typed view is needed.
+    """
+
     id: str
     platform: str  # "threads" | "x" | "linkedin" | "instagram"
     action: str  # "post" | "reply"
@@ -48,78 +73,108 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _ensure_file():
-    if not QUEUE_FILE.exists():
-        QUEUE_FILE.touch()
-
-
-def _append_record(rec: PostApproval) -> None:
-    _ensure_file()
-    with QUEUE_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(asdict(rec), ensure_ascii=False) + "\n")
-
-
-def _read_all() -> List[PostApproval]:
-    _ensure_file()
-    out: List[PostApproval] = []
-    with QUEUE_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            out.append(PostApproval(**data))
-    return out
-
-
-def _write_all(recs: List[PostApproval]) -> None:
+# Newest record per id, replayed from the log once on first use. Each log
+# line is a full record, so replay is simply "last line wins".
+_index: Optional[Dict[str, Dict[str, Any]]] = None
+# Log lines superseded by a later line for the same id; drives compaction.
+_stale_lines = 0
+_COMPACT_MIN_STALE = 64
+
+
+def _ensure_index() -> Dict[str, Dict[str, Any]]:
+    global _index, _stale_lines
+    if _index is None:
+        _index = {}
+        _stale_lines = 0
+        # EAFP: a missing log just means an empty queue — no stat probe.
+        try:
+            with open(QUEUE_FILE, "rb", buffering=65536) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    data = _loads(line)
+                    if data["id"] in _index:
+                        _stale_lines += 1
+                    _index[data["id"]] = data
+        except FileNotFoundError:
+            pass
+    return _index
+
+
+def _append_line(rec: Dict[str, Any]) -> None:
+    with QUEUE_FILE.open("ab") as f:
+        f.write(_dump_line(rec))
+
+
+def _append_record(rec: Dict[str, Any]) -> None:
+    _ensure_index()[rec["id"]] = rec
+    _append_line(rec)
+
+
+def _compact() -> None:
+    """Rewrite the log with one line per record, dropping superseded lines."""
+    global _stale_lines
     tmp = QUEUE_FILE.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        for r in recs:
-            f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
+    with tmp.open("wb") as f:
+        for rec in _ensure_index().values():
+            f.write(_dump_line(rec))
     tmp.replace(QUEUE_FILE)
+    _stale_lines = 0
 
 
 async def enqueue_post(platform: str, action: str, text: str, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    rec = PostApproval(
-        id=str(uuid.uuid4())[:8],
-        platform=platform,
-        action=action,
-        text=text,
-        meta=meta or {},
-        status="pending",
-        created_at=_now_iso(),
-        updated_at=_now_iso(),
-    )
+    now = _now_iso()
+    rec = {
+        "id": str(uuid.uuid4())[:8],
+        "platform": platform,
+        "action": action,
+        "text": text,
+        "meta": meta or {},
+        "status": "pending",
+        "created_at": now,
+        "updated_at": now,
+        "post_id": None,
+        "error": None,
+    }
     async with _file_lock:
         _append_record(rec)
-    return {"success": True, "queued": True, "approval_id": rec.id, "text": text}
+    return {"success": True, "queued": True, "approval_id": rec["id"], "text": text}
 
 
 def list_pending() -> List[Dict[str, Any]]:
-    return [asdict(r) for r in _read_all() if r.status == "pending"]
+    return [dict(r) for r in _ensure_index().values() if r["status"] == "pending"]
+
+
+def _update_status(rec_id: str, status: str, **kw) -> Optional[Dict[str, Any]]:
+    global _stale_lines
+    rec = _ensure_index().get(rec_id)
+    if rec is None:
+        return None
+    rec["status"] = status
+    rec["updated_at"] = _now_iso()
+    rec.update(kw)
+    # Append the full updated record; the index (and replay) keep the
+    # newest line per id, so no full-file rewrite is needed here.
+    _append_line(rec)
+    _stale_lines += 1
+    if _stale_lines >= _COMPACT_MIN_STALE and _stale_lines > len(_index):
+        _compact()
+    return rec
 
 
-def _update_status(rec_id: str, status: str, **kw) -> Optional[PostApproval]:
-    recs = _read_all()
-    found = None
-    for r in recs:
-        if r.id == rec_id:
-            r.status = status
-            r.updated_at = _now_iso()
-            for k, v in kw.items():
-                setattr(r, k, v)
-            found = r
-            break
-    if found:
-        _write_all(recs)
-    return found
+_client_cache: Dict[str, Any] = {}
 
 
-_client_cache: Dict[str, Any] = {}
+async def close_clients():
+    """Close the cached clients' HTTP sessions; call on server shutdown."""
+    for client in _client_cache.values():
+        close = getattr(client, "close", None)
+        if close is not None:
+            await close()
 
 
-def _get_client(platform: str):
+def get_client(platform: str):
     """Return a cached singleton SNS client for the given platform."""
     if platform in _client_cache:
         return _client_cache[platform]
@@ -145,32 +200,31 @@ def _get_client(platform: str):
 
 async def approve_and_execute(rec_id: str) -> Dict[str, Any]:
     async with _file_lock:
-        recs = _read_all()
-        target = next((r for r in recs if r.id == rec_id), None)
+        target = _ensure_index().get(rec_id)
         if not target:
             return {"success": False, "error": "not_found"}
-        if target.status != "pending":
-            return {"success": False, "error": f"invalid_status:{target.status}"}
+        if target["status"] != "pending":
+            return {"success": False, "error": f"invalid_status:{target['status']}"}
         _update_status(rec_id, "approved")
 
     try:
-        client = _get_client(target.platform)
-        if target.action == "post":
-            if target.platform == "instagram":
-                image_url = target.meta.get("image_url", "")
-                res = await client.post(target.text, image_url)
+        client = get_client(target["platform"])
+        if target["action"] == "post":
+            if target["platform"] == "instagram":
+                image_url = target["meta"].get("image_url", "")
+                res = await client.post(target["text"], image_url)
             else:
-                res = await client.post(target.text)
-        elif target.action == "reply":
-            reply_id = target.meta.get("tweet_id") or target.meta.get("post_id", "")
-            res = await client.reply(target.text, reply_id)
+                res = await client.post(target["text"])
+        elif target["action"] == "reply":
+            reply_id = target["meta"].get("tweet_id") or target["meta"].get("post_id", "")
+            res = await client.reply(target["text"], reply_id)
         else:
-            raise ValueError(f"unsupported action: {target.action}")
+            raise ValueError(f"unsupported action: {target['action']}")
 
         if res.success:
             async with _file_lock:
                 _update_status(rec_id, "posted", post_id=res.post_id)
-            return {"success": True, "post_id": res.post_id, "text": target.text}
+            return {"success": True, "post_id": res.post_id, "text": target["text"]}
         else:
             async with _file_lock:
                 _update_status(rec_id, "failed", error=res.error)
@@ -12,6 +12,10 @@ from src.adapters.web.sns_routes import sns_router
 from src.domain.persona import BOT_PERSONA
 
 app = FastAPI(title="Smol Claw Marketing Server")
+
+# Strong references to fire-and-forget tasks; asyncio only keeps a weak
+# reference, so an untracked task can be garbage-collected mid-flight.
+_background_tasks: set = set()
 app.include_router(sns_router)
 
 # Global executor
@@ -79,8 +83,17 @@ async def startup_event():
             except Exception as e:
                 print(f"Multi-bot system failed to start: {e}")
 
-        asyncio.create_task(_start_multi_bots())
+        task = asyncio.create_task(_start_multi_bots())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     else:
         print("Discord bots not configured (set DISCORD_*_TOKEN in .env)")
 
     print("Ready!")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared SNS client sessions on server shutdown."""
+    from src.adapters.web.approval_queue import close_clients
+    await close_clients()
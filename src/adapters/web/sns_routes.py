@@ -4,15 +4,21 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
-from src.adapters.sns.x import XClient
-from src.adapters.sns.threads import ThreadsClient
 from src.config import CONFIG
-from src.adapters.web.approval_queue import enqueue_post, approve_and_execute, reject, list_pending
+from src.adapters.web.approval_queue import (
+    enqueue_post,
+    approve_and_execute,
+    reject,
+    list_pending,
+    get_client,
+)
 
 sns_router = APIRouter(prefix="/sns", tags=["SNS"])
 
-x_client = XClient()
-threads_client = ThreadsClient()
+# Share the approval queue's cached singletons so routes and
+# approve_and_execute talk through the same clients (and sessions).
+x_client = get_client("x")
+threads_client = get_client("threads")
 
 
 class SNSPostRequest(BaseModel):
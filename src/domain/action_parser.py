@@ -36,6 +36,8 @@ MAX_ACTIONS_PER_MESSAGE = 2
 
 def parse_actions(text: str) -> List[ActionBlock]:
     """Extract action blocks from LLM response text."""
+    if "[ACTION:" not in text:
+        return []  # fast path: most responses carry no actions
     return [
         ActionBlock(action_type=action_type, body=body.strip())
         for action_type, body in ACTION_RE.findall(text)
@@ -44,6 +46,8 @@ def parse_actions(text: str) -> List[ActionBlock]:
 
 def strip_actions(text: str) -> str:
     """Remove all action blocks from text."""
+    if "[ACTION:" not in text:
+        return text.strip()
     return ACTION_RE.sub("", text).strip()
 
 
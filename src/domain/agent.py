@@ -70,6 +70,7 @@ class AgentBrain:
         self._approval = approval
         self._action_lock = asyncio.Lock()
         self._channel_history: OrderedDict[int, List[Dict[str, str]]] = OrderedDict()
+        self._history_msg_count = 0  # running total across channels
         self._max_history = 10
         self._current_model: str = DEFAULT_MODEL
         self._active: bool = True
@@ -107,8 +108,8 @@ class AgentBrain:
         self._rehired = value
 
     def history_message_count(self) -> int:
-        """Total message count across all channels (for HR status reports)."""
-        return sum(len(h) for h in self._channel_history.values())
+        """Total message count across all channels (O(1) running counter)."""
+        return self._history_msg_count
 
     def wire(
         self,
@@ -124,6 +125,7 @@ class AgentBrain:
     def clear_history(self):
         """Clear all conversation history."""
         self._channel_history.clear()
+        self._history_msg_count = 0
         _log(f"[{self.bot_name}] conversation history cleared")
 
     def should_respond(self, msg: IncomingMessage) -> bool:
@@ -182,7 +184,8 @@ class AgentBrain:
         else:
             self._channel_history[channel_id] = []
             while len(self._channel_history) > self._MAX_CHANNELS:
-                evicted_id, _ = self._channel_history.popitem(last=False)
+                evicted_id, evicted = self._channel_history.popitem(last=False)
+                self._history_msg_count -= len(evicted)
                 _log(f"[{self.bot_name}] evicted channel history: {evicted_id}")
         history = self._channel_history[channel_id]
 
@@ -207,7 +210,9 @@ class AgentBrain:
         history = self._channel_history.get(channel_id, [])
         history.append({"role": "user", "text": user_message})
         history.append({"role": "assistant", "text": response[:200]})
+        self._history_msg_count += 2
         if len(history) > self._max_history * 2:
+            self._history_msg_count -= len(history) - self._max_history * 2
             history = history[-self._max_history * 2:]
         self._channel_history[channel_id] = history
 
@@ -396,8 +401,4 @@ class AgentBrain:
         """Split a message into chunks that fit Discord's character limit."""
         if len(text) <= limit:
             return [text]
-        chunks = []
-        while text:
-            chunks.append(text[:limit])
-            text = text[limit:]
-        return chunks
+        return [text[i:i + limit] for i in range(0, len(text), limit)]
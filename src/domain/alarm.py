@@ -3,24 +3,43 @@
 Pure domain logic, no framework dependencies.
 """
 
+import asyncio
 import json
 import os
-import re
 import sys
 import tempfile
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+try:
+    import orjson
+except ImportError:  # optional — stdlib json works, orjson is just faster
+    orjson = None
+
 
 def _log(msg: str):
     print(msg, file=sys.stderr)
 
 
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """Serialize to indented JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 @dataclass
 class AlarmEntry:
     alarm_id: str
@@ -38,25 +57,109 @@ class AlarmEntry:
     enabled: bool = True
 
 
-# Schedule string patterns
-_DAILY_RE = re.compile(r"^daily\s+(\d{1,2}):(\d{2})$", re.IGNORECASE)
-_WEEKDAY_RE = re.compile(r"^weekday\s+(\d{1,2}):(\d{2})$", re.IGNORECASE)
-_INTERVAL_H_RE = re.compile(r"^every\s+(\d+)h$", re.IGNORECASE)
-_INTERVAL_M_RE = re.compile(r"^every\s+(\d+)m$", re.IGNORECASE)
-_ONCE_H_RE = re.compile(r"^once\s+(\d+)h$", re.IGNORECASE)
-_ONCE_M_RE = re.compile(r"^once\s+(\d+)m$", re.IGNORECASE)
+_ALARM_FIELDS = tuple(f.name for f in fields(AlarmEntry))
+
+
+def _entry_to_dict(a: AlarmEntry) -> dict:
+    """Flat dict for serialization; cheaper than dataclasses.asdict's
+    recursive deepcopy. Keep in sync with AlarmEntry."""
+    return {
+        "alarm_id": a.alarm_id,
+        "schedule_type": a.schedule_type,
+        "hour": a.hour,
+        "minute": a.minute,
+        "interval_minutes": a.interval_minutes,
+        "tz": a.tz,
+        "prompt": a.prompt,
+        "channel_id": a.channel_id,
+        "created_by": a.created_by,
+        "created_at": a.created_at,
+        "last_run": a.last_run,
+        "fire_at": a.fire_at,
+        "enabled": a.enabled,
+    }
+
 
 _MAX_ALARMS_PER_BOT = 20
 _MIN_INTERVAL_MINUTES = 10
+_FLUSH_DELAY_SECONDS = 2.0  # coalesce alarm-file writes within this window
+
+# Resolved ZoneInfo objects by name — alarms cluster on a handful of
+# timezones, and every due-check needs one.
+_TZ_CACHE: Dict[str, ZoneInfo] = {}
+
+
+def _get_tz(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo; raises like ZoneInfo() on unknown names."""
+    tz = _TZ_CACHE.get(name)
+    if tz is None:
+        tz = ZoneInfo(name)
+        _TZ_CACHE[name] = tz
+    return tz
+
+
+class FileAlarmStore:
+    """Default persistence: indented JSON at <storage_dir>/alarms_<bot>.json."""
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    def load(self) -> Optional[list]:
+        """Return the raw list of alarm dicts, or None if no file exists."""
+        if not self._path.exists():
+            return None
+        raw = _loads(self._path.read_bytes())
+        return raw if isinstance(raw, list) else None
+
+    def save(self, data: list) -> None:
+        """Atomic write: temp file in same directory, then replace."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        content = _dumps(data)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, str(self._path))
+        except BaseException:
+            # Clean up temp file on failure
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+class InMemoryAlarmStore:
+    """List-backed store with no disk I/O; lets tests skip tempdirs."""
+
+    def __init__(self):
+        self._data: Optional[list] = None
+
+    def load(self) -> Optional[list]:
+        if self._data is None:
+            return None
+        return [dict(item) for item in self._data]
+
+    def save(self, data: list) -> None:
+        self._data = [dict(item) for item in data]
 
 
 class AlarmScheduler:
     """Manages alarm entries for a single bot: CRUD, persistence, due-checking."""
 
-    def __init__(self, bot_name: str, storage_dir: str = "memory"):
+    def __init__(self, bot_name: str, storage_dir: str = "memory", store=None):
         self._bot_name = bot_name
-        self._storage_path = Path(storage_dir) / f"alarms_{bot_name}.json"
+        if store is None:
+            store = FileAlarmStore(Path(storage_dir) / f"alarms_{bot_name}.json")
+        self._store = store
         self._alarms: Dict[str, AlarmEntry] = {}
+        # Parsed last_run per alarm_id; refreshed on mark_run, cleared on load
+        self._last_run_dt: Dict[str, Optional[datetime]] = {}
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Earliest instant anything could fire; lets ticks skip the scan.
+        # None = unknown, scan normally. Reset on any mutation.
+        self._next_due_utc: Optional[datetime] = None
         self._load()
 
     def add_alarm(
@@ -74,7 +177,7 @@ class AlarmScheduler:
         parsed = self._parse_schedule(schedule_str)
         # Validate timezone
         try:
-            ZoneInfo(tz)
+            _get_tz(tz)
         except (ZoneInfoNotFoundError, KeyError):
             raise ValueError(f"잘못된 타임존: {tz!r}")
 
@@ -96,14 +199,17 @@ class AlarmScheduler:
             entry.fire_at = fire_at_dt.isoformat()
 
         self._alarms[alarm_id] = entry
-        self._save()
+        self._next_due_utc = None
+        self._mark_dirty()
         return entry
 
     def remove_alarm(self, alarm_id: str) -> bool:
         """Remove alarm by ID. Returns True if found and removed."""
         if alarm_id in self._alarms:
             del self._alarms[alarm_id]
-            self._save()
+            self._last_run_dt.pop(alarm_id, None)
+            self._next_due_utc = None
+            self._mark_dirty()
             return True
         return False
 
@@ -113,84 +219,184 @@ class AlarmScheduler:
 
     def get_due_alarms(self, now_utc: datetime) -> List[AlarmEntry]:
         """Return alarms that should fire now."""
+        if self._next_due_utc is not None and now_utc < self._next_due_utc:
+            return []
         due = []
+        # Alarms cluster on a handful of timezones — convert the current
+        # instant once per tz instead of once per alarm.
+        local_now: Dict[str, Optional[datetime]] = {}
         for alarm in self._alarms.values():
             if not alarm.enabled:
                 continue
-            if self._is_due(alarm, now_utc):
+            if alarm.tz not in local_now:
+                try:
+                    local_now[alarm.tz] = now_utc.astimezone(_get_tz(alarm.tz))
+                except (ZoneInfoNotFoundError, KeyError):
+                    local_now[alarm.tz] = None
+            now_local = local_now[alarm.tz]
+            if now_local is None:
+                _log(f"[_is_due] {alarm.alarm_id}: bad tz {alarm.tz!r}")
+                continue
+            if self._is_due(alarm, now_utc, now_local):
                 due.append(alarm)
+        if due:
+            self._next_due_utc = None
+        else:
+            self._next_due_utc = self._estimate_next_due(now_utc, local_now)
         return due
 
+    def _estimate_next_due(self, now_utc: datetime, local_now: Dict[str, Optional[datetime]]) -> Optional[datetime]:
+        """Lower bound on the next instant any enabled alarm can fire.
+
+        Only called after a scan found nothing due. Returning None keeps
+        full scans; the bound errs early (daily alarms get an hour of
+        slack for DST shifts) so a fire is never skipped.
+        """
+        candidates = []
+        for alarm in self._alarms.values():
+            if not alarm.enabled:
+                continue
+            if alarm.schedule_type == "interval":
+                last_run = self._parsed_last_run(alarm)
+                if last_run is None:
+                    return None  # would be due — don't throttle
+                try:
+                    candidates.append(last_run + timedelta(minutes=alarm.interval_minutes))
+                except TypeError:
+                    return None  # corrupt interval_minutes — keep scanning
+            elif alarm.schedule_type == "once":
+                if alarm.last_run or not alarm.fire_at:
+                    continue  # already fired / never will
+                try:
+                    candidates.append(datetime.fromisoformat(alarm.fire_at))
+                except (ValueError, TypeError):
+                    continue
+            elif alarm.schedule_type in ("daily", "weekday"):
+                now_local = local_now.get(alarm.tz)
+                if now_local is None:
+                    continue  # bad tz — can never fire
+                scheduled = now_local.replace(
+                    hour=alarm.hour, minute=alarm.minute, second=0, microsecond=0
+                )
+                if now_local >= scheduled:
+                    scheduled += timedelta(days=1)
+                candidates.append(
+                    scheduled.astimezone(timezone.utc) - timedelta(hours=1)
+                )
+            else:
+                return None  # unknown type — keep scanning
+        if not candidates:
+            return None
+        return max(min(candidates), now_utc)
+
     def mark_run(self, alarm_id: str, now_utc: datetime):
         """Update last_run timestamp after execution."""
         alarm = self._alarms.get(alarm_id)
         if alarm:
             alarm.last_run = now_utc.isoformat()
-            self._save()
+            self._last_run_dt[alarm_id] = now_utc
+            self._next_due_utc = None
+            self._mark_dirty()
 
     @staticmethod
     def _parse_schedule(schedule_str: str) -> dict:
-        """Parse schedule string into structured dict."""
-        s = schedule_str.strip()
+        """Parse schedule string into structured dict.
 
-        m = _DAILY_RE.match(s)
-        if m:
-            hour, minute = int(m.group(1)), int(m.group(2))
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError(f"잘못된 시간: {s}")
-            return {"type": "daily", "hour": hour, "minute": minute}
-
-        m = _WEEKDAY_RE.match(s)
-        if m:
-            hour, minute = int(m.group(1)), int(m.group(2))
+        The formats are fixed two-token strings, so a split + startswith
+        parser beats regex matching on this hot path.
+        """
+        s = schedule_str.strip()
+        parts = s.lower().split(None, 1)
+        head = parts[0] if parts else ""
+        rest = parts[1] if len(parts) > 1 else ""
+
+        if head in ("daily", "weekday") and rest:
+            hh, sep, mm = rest.partition(":")
+            if not (sep and 1 <= len(hh) <= 2 and len(mm) == 2
+                    and hh.isdigit() and mm.isdigit()):
+                raise AlarmScheduler._bad_schedule(s)
+            hour, minute = int(hh), int(mm)
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 raise ValueError(f"잘못된 시간: {s}")
-            return {"type": "weekday", "hour": hour, "minute": minute}
-
-        m = _INTERVAL_H_RE.match(s)
-        if m:
-            hours = int(m.group(1))
-            minutes = hours * 60
-            if minutes < _MIN_INTERVAL_MINUTES:
-                raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {hours}시간)")
-            return {"type": "interval", "interval_minutes": minutes}
-
-        m = _INTERVAL_M_RE.match(s)
-        if m:
-            minutes = int(m.group(1))
-            if minutes < _MIN_INTERVAL_MINUTES:
-                raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {minutes}분)")
-            return {"type": "interval", "interval_minutes": minutes}
-
-        m = _ONCE_H_RE.match(s)
-        if m:
-            hours = int(m.group(1))
-            minutes = hours * 60
-            if minutes < _MIN_INTERVAL_MINUTES:
-                raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {hours}시간)")
-            return {"type": "once", "interval_minutes": minutes}
-
-        m = _ONCE_M_RE.match(s)
-        if m:
-            minutes = int(m.group(1))
-            if minutes < _MIN_INTERVAL_MINUTES:
-                raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {minutes}분)")
-            return {"type": "once", "interval_minutes": minutes}
-
-        raise ValueError(f"잘못된 스케줄 형식: {s!r}. "
-                         f"지원: daily HH:MM, weekday HH:MM, every Nh, every Nm, once Nh, once Nm")
+            return {"type": head, "hour": hour, "minute": minute}
+
+        if head in ("every", "once") and rest:
+            num, unit = rest[:-1], rest[-1]
+            if unit not in ("h", "m") or not num.isdigit():
+                raise AlarmScheduler._bad_schedule(s)
+            if unit == "h":
+                hours = int(num)
+                minutes = hours * 60
+                if minutes < _MIN_INTERVAL_MINUTES:
+                    raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {hours}시간)")
+            else:
+                minutes = int(num)
+                if minutes < _MIN_INTERVAL_MINUTES:
+                    raise ValueError(f"최소 간격은 {_MIN_INTERVAL_MINUTES}분 (요청: {minutes}분)")
+            return {"type": "interval" if head == "every" else "once",
+                    "interval_minutes": minutes}
+
+        raise AlarmScheduler._bad_schedule(s)
 
     @staticmethod
-    def _is_due(alarm: AlarmEntry, now_utc: datetime) -> bool:
-        """Check if alarm should fire at this time."""
+    def _bad_schedule(s: str) -> ValueError:
+        return ValueError(f"잘못된 스케줄 형식: {s!r}. "
+                          f"지원: daily HH:MM, weekday HH:MM, every Nh, every Nm, once Nh, once Nm")
+
+    def _mark_dirty(self):
+        """Persist soon: debounce writes while an event loop is running.
+
+        A burst of mutations (e.g. many alarms firing in one tick) then
+        costs one file rewrite instead of one per mutation. Without a
+        running loop (sync callers, tests) this saves immediately.
+        """
         try:
-            tz = ZoneInfo(alarm.tz)
-        except (ZoneInfoNotFoundError, KeyError):
-            _log(f"[_is_due] {alarm.alarm_id}: bad tz {alarm.tz!r}")
-            return False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        self._dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(_FLUSH_DELAY_SECONDS, self._flush_now)
+
+    def _flush_now(self):
+        self._flush_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._save()
 
-        now_local = now_utc.astimezone(tz)
+    def flush(self):
+        """Write any pending changes immediately (call on shutdown)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._save()
 
+    def _parsed_last_run(self, alarm: AlarmEntry) -> Optional[datetime]:
+        """Parsed alarm.last_run; cached since it only changes on mark_run."""
+        if alarm.alarm_id not in self._last_run_dt:
+            dt = None
+            if alarm.last_run:
+                try:
+                    dt = datetime.fromisoformat(alarm.last_run)
+                except (ValueError, TypeError):
+                    dt = None
+                else:
+                    if dt.tzinfo is None:
+                        # Hand-edited files may carry naive timestamps;
+                        # treat them as UTC so aware-datetime math works.
+                        dt = dt.replace(tzinfo=timezone.utc)
+            self._last_run_dt[alarm.alarm_id] = dt
+        return self._last_run_dt[alarm.alarm_id]
+
+    def _is_due(self, alarm: AlarmEntry, now_utc: datetime, now_local: datetime) -> bool:
+        """Check if alarm should fire at this time.
+
+        now_local must be now_utc converted to the alarm's timezone; the
+        caller precomputes it once per distinct tz.
+        """
         if alarm.schedule_type in ("daily", "weekday"):
             # weekday: skip weekends (5=Saturday, 6=Sunday)
             if alarm.schedule_type == "weekday" and now_local.weekday() >= 5:
@@ -205,26 +411,23 @@ class AlarmScheduler:
                 return False
 
             # Check last_run — should not have run today
-            if alarm.last_run:
-                try:
-                    last_run_utc = datetime.fromisoformat(alarm.last_run)
-                    last_run_local = last_run_utc.astimezone(tz)
-                    if last_run_local.date() == now_local.date():
-                        return False
-                except (ValueError, TypeError):
-                    pass
+            last_run_utc = self._parsed_last_run(alarm)
+            if last_run_utc is not None:
+                last_run_local = last_run_utc.astimezone(now_local.tzinfo)
+                if last_run_local.date() == now_local.date():
+                    return False
 
             return True
 
         if alarm.schedule_type == "interval":
-            if not alarm.last_run:
-                return True  # Never run — fire immediately
+            last_run_utc = self._parsed_last_run(alarm)
+            if last_run_utc is None:
+                return True  # Never run (or unparseable) — fire immediately
+            elapsed = (now_utc - last_run_utc).total_seconds() / 60
             try:
-                last_run_utc = datetime.fromisoformat(alarm.last_run)
-                elapsed = (now_utc - last_run_utc).total_seconds() / 60
                 return elapsed >= alarm.interval_minutes
-            except (ValueError, TypeError):
-                return True
+            except TypeError:
+                return True  # corrupt interval_minutes — degrade by firing
 
         if alarm.schedule_type == "once":
             if alarm.last_run:
@@ -237,54 +440,48 @@ class AlarmScheduler:
         return False
 
     def _load(self):
-        """Load alarms from JSON file."""
+        """Load alarms from the backing store."""
         self._alarms.clear()
+        self._last_run_dt.clear()
         try:
-            if self._storage_path.exists():
-                raw = json.loads(self._storage_path.read_text(encoding="utf-8"))
-                if isinstance(raw, list):
-                    for item in raw:
-                        if isinstance(item, dict) and "alarm_id" in item:
+            raw = self._store.load()
+            if raw:
+                for item in raw:
+                    if isinstance(item, dict) and "alarm_id" in item:
+                        # Fast path: records written by our own _save carry
+                        # exactly these fields with the right types.
+                        try:
                             entry = AlarmEntry(
-                                alarm_id=str(item["alarm_id"]),
-                                schedule_type=str(item.get("schedule_type", "")),
-                                hour=item.get("hour"),
-                                minute=item.get("minute"),
-                                interval_minutes=item.get("interval_minutes"),
-                                tz=str(item.get("tz", "Asia/Seoul")),
-                                prompt=str(item.get("prompt", "")),
-                                channel_id=int(item.get("channel_id", 0)),
-                                created_by=str(item.get("created_by", "")),
-                                created_at=str(item.get("created_at", "")),
-                                last_run=str(item.get("last_run", "")),
-                                fire_at=str(item.get("fire_at", "")),
-                                enabled=bool(item.get("enabled", True)),
+                                **{k: item[k] for k in _ALARM_FIELDS if k in item}
                             )
-                            self._alarms[entry.alarm_id] = entry
+                        except TypeError:
+                            entry = self._coerce_entry(item)
+                        self._alarms[entry.alarm_id] = entry
         except Exception as e:
             _log(f"[AlarmScheduler:{self._bot_name}] load failed: {e}")
 
+    @staticmethod
+    def _coerce_entry(item: dict) -> AlarmEntry:
+        """Defensive field-by-field coercion for hand-edited alarm files."""
+        return AlarmEntry(
+            alarm_id=str(item["alarm_id"]),
+            schedule_type=str(item.get("schedule_type", "")),
+            hour=item.get("hour"),
+            minute=item.get("minute"),
+            interval_minutes=item.get("interval_minutes"),
+            tz=str(item.get("tz", "Asia/Seoul")),
+            prompt=str(item.get("prompt", "")),
+            channel_id=int(item.get("channel_id", 0)),
+            created_by=str(item.get("created_by", "")),
+            created_at=str(item.get("created_at", "")),
+            last_run=str(item.get("last_run", "")),
+            fire_at=str(item.get("fire_at", "")),
+            enabled=bool(item.get("enabled", True)),
+        )
+
     def _save(self):
-        """Persist alarms to JSON file (atomic write via tmp + replace)."""
+        """Persist alarms to the backing store."""
         try:
-            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-            data = [asdict(a) for a in self._alarms.values()]
-            content = json.dumps(data, ensure_ascii=False, indent=2)
-            # Atomic write: write to temp file in same directory, then replace
-            fd, tmp_path = tempfile.mkstemp(
-                dir=str(self._storage_path.parent),
-                suffix=".tmp",
-            )
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(content)
-                os.replace(tmp_path, str(self._storage_path))
-            except BaseException:
-                # Clean up temp file on failure
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            self._store.save([_entry_to_dict(a) for a in self._alarms.values()])
         except Exception as e:
             _log(f"[AlarmScheduler:{self._bot_name}] save failed: {e}")
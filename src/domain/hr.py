@@ -7,15 +7,17 @@ No Discord dependency. Bots are accessed via public properties:
 """
 
 import sys
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
 def _log(msg: str):
     print(msg, file=sys.stderr)
 
 
-# Normalize various bot name inputs to registry keys
-BOT_NAME_ALIASES: Dict[str, str] = {
+# Normalize various bot name inputs to registry keys.
+# Read-only view — the table is fixed at import time.
+BOT_NAME_ALIASES: Mapping[str, str] = MappingProxyType({
     "threads": "threads",
     "threadsbot": "threads",
     "stitch": "threads",
@@ -36,7 +38,10 @@ BOT_NAME_ALIASES: Dict[str, str] = {
     "teamleadbot": "lead",
     "hr": "hr",
     "hrbot": "hr",
-}
+})
+
+# Every registry key the alias table can resolve to
+_ALIAS_TARGETS = frozenset(BOT_NAME_ALIASES.values())
 
 # Protected bots that cannot be fired
 PROTECTED_KEYS = frozenset({"lead", "hr"})
@@ -46,14 +51,28 @@ HISTORY_WARN_THRESHOLD = 10
 HISTORY_FIRE_THRESHOLD = 15
 
 
+# "Available bots" string for unknown-name errors, keyed by registry
+# identity and size — recomputing the sorted join per typo adds up.
+_available_cache: Tuple[int, int, str] = (0, -1, "")
+
+
+def _available_bots(registry: Dict[str, Any]) -> str:
+    global _available_cache
+    reg_id, size, cached = _available_cache
+    if reg_id == id(registry) and size == len(registry):
+        return cached
+    available = ", ".join(sorted(_ALIAS_TARGETS & registry.keys()))
+    _available_cache = (id(registry), len(registry), available)
+    return available
+
+
 def resolve_bot(
     name: str, registry: Dict[str, Any], caller: str = "HR",
 ) -> Tuple[Optional[str], Any]:
     """Resolve a bot name to (registry_key, bot_instance) or (None, error_msg)."""
     key = BOT_NAME_ALIASES.get(name.lower().strip())
     if not key:
-        available = ", ".join(sorted({v for v in BOT_NAME_ALIASES.values() if v in registry}))
-        return None, f"[{caller}] 알 수 없는 봇: {name!r}. 가능한 봇: {available}"
+        return None, f"[{caller}] 알 수 없는 봇: {name!r}. 가능한 봇: {_available_bots(registry)}"
     bot = registry.get(key)
     if not bot:
         return None, f"[{caller}] '{key}' 봇이 레지스트리에 등록되지 않았음."
@@ -3,9 +3,10 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionBlock:
-    """Parsed action from LLM response."""
+    """Parsed action from LLM response. Immutable and slotted — many are
+    created per response and none are ever mutated."""
 
     action_type: str  # e.g. "POST_THREADS", "SET_ALARM"
     body: str
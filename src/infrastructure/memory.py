@@ -1,6 +1,7 @@
 """Memory management system."""
 
 import json
+import os
 import sys
 import uuid
 from collections import Counter
@@ -8,6 +9,36 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:  # optional — stdlib json works, orjson is just faster
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """Serialize to indented JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """Write bytes to a sibling tmp file, then rename over the target.
+
+    POSIX rename is atomic within a directory, so concurrent readers see
+    either the old or the new contents — never a truncated file.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
 
 class SimpleMemory:
     """Simple JSON-based memory management with no external dependencies"""
@@ -18,24 +49,32 @@ class SimpleMemory:
         self.max_decisions = 100
         self.decisions_file = self.memory_dir / "decisions.json"
         self.summary_file = self.memory_dir / "summary.txt"
+        # (mtime_ns, parsed list) — skips re-parsing when the file is unchanged
+        self._decisions_cache = None
 
     def load_decisions(self) -> List[Dict[str, Any]]:
-        """Load decisions from JSON file"""
-        if not self.decisions_file.exists():
+        """Load decisions from JSON file (cached until the file changes)"""
+        try:
+            mtime = self.decisions_file.stat().st_mtime_ns
+        except OSError:
             return []
+        if self._decisions_cache is not None and self._decisions_cache[0] == mtime:
+            return list(self._decisions_cache[1])
         try:
-            with open(self.decisions_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            data = _loads(self.decisions_file.read_bytes())
         except Exception as e:
             print(f"Failed to load decisions: {e}", file=sys.stderr)
             return []
+        self._decisions_cache = (mtime, data)
+        return list(data)
 
     def save_decisions(self, decisions: List[Dict[str, Any]]):
         """Save decisions to JSON file"""
         try:
-            with open(self.decisions_file, "w", encoding="utf-8") as f:
-                json.dump(decisions, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.decisions_file, _dumps(decisions))
+            self._decisions_cache = (self.decisions_file.stat().st_mtime_ns, list(decisions))
         except Exception as e:
+            self._decisions_cache = None
             print(f"Failed to save decisions: {e}", file=sys.stderr)
 
     def load_summary(self) -> str:
@@ -56,15 +95,20 @@ class SimpleMemory:
 
     def add_decision(self, decision: Dict[str, Any]):
         """Add a new decision and auto-manage memory"""
+        self.add_decisions([decision])
+
+    def add_decisions(self, new_decisions: List[Dict[str, Any]]):
+        """Add several decisions with one load/save round-trip"""
         decisions = self.load_decisions()
 
-        # Add new decision with metadata
-        decision_entry = {
-            "id": str(uuid.uuid4())[:8],
-            "timestamp": datetime.now().isoformat(),
-            **decision
-        }
-        decisions.append(decision_entry)
+        # Add new decisions with metadata
+        timestamp = datetime.now().isoformat()
+        for decision in new_decisions:
+            decisions.append({
+                "id": str(uuid.uuid4())[:8],
+                "timestamp": timestamp,
+                **decision
+            })
 
         # If exceeded max, create summary of old decisions
         if len(decisions) > self.max_decisions:
@@ -119,13 +163,15 @@ class SimpleMemory:
         """Check if this message was sent recently (24h window)"""
         decisions = self.load_decisions()
         yesterday = datetime.now() - timedelta(days=1)
+        # Tokenize the incoming message once instead of per stored decision
+        message_words = frozenset(message.lower().split())
 
         for d in decisions:
             try:
                 decision_time = datetime.fromisoformat(d.get("timestamp", ""))
                 if decision_time > yesterday:
-                    prev_message = d.get("message", "")
-                    if self._similarity(message, prev_message) > 0.85:
+                    prev_words = frozenset(d.get("message", "").lower().split())
+                    if self._word_similarity(message_words, prev_words) > 0.85:
                         print(f"Skipping duplicate: '{message[:50]}...'", file=sys.stderr)
                         return True
             except Exception:
@@ -136,12 +182,13 @@ class SimpleMemory:
     @staticmethod
     def _similarity(a: str, b: str) -> float:
         """Calculate simple word-based similarity"""
-        if not a or not b:
-            return 0.0
-
-        words_a = set(a.lower().split())
-        words_b = set(b.lower().split())
+        return SimpleMemory._word_similarity(
+            frozenset(a.lower().split()), frozenset(b.lower().split())
+        )
 
+    @staticmethod
+    def _word_similarity(words_a: frozenset, words_b: frozenset) -> float:
+        """Jaccard similarity between two pre-tokenized word sets"""
         if not words_a or not words_b:
             return 0.0
 
@@ -157,23 +204,30 @@ class GuardrailMemory(SimpleMemory):
     def __init__(self, memory_dir: str = "memory"):
         super().__init__(memory_dir)
         self.violations_file = self.memory_dir / "guardrail_violations.json"
+        self._violations_cache = None
 
     def load_violations(self) -> List[Dict[str, Any]]:
-        """Load guardrail violations"""
-        if not self.violations_file.exists():
+        """Load guardrail violations (cached until the file changes)"""
+        try:
+            mtime = self.violations_file.stat().st_mtime_ns
+        except OSError:
             return []
+        if self._violations_cache is not None and self._violations_cache[0] == mtime:
+            return list(self._violations_cache[1])
         try:
-            with open(self.violations_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            data = _loads(self.violations_file.read_bytes())
         except Exception:
             return []
+        self._violations_cache = (mtime, data)
+        return list(data)
 
     def save_violations(self, violations: List[Dict[str, Any]]):
         """Save guardrail violations"""
         try:
-            with open(self.violations_file, "w", encoding="utf-8") as f:
-                json.dump(violations, f, indent=2, ensure_ascii=False)
+            _write_atomic(self.violations_file, _dumps(violations))
+            self._violations_cache = (self.violations_file.stat().st_mtime_ns, list(violations))
         except Exception as e:
+            self._violations_cache = None
             print(f"Failed to save violations: {e}", file=sys.stderr)
 
     def record_violation(self, violation_type: str, target: str, reason: str):
@@ -208,15 +262,22 @@ class GuardrailMemory(SimpleMemory):
         frequent_targets = Counter([v.get("target") for v in recent])
         frequent_types = Counter([v.get("type") for v in recent])
 
+        target_lines = "\n".join(
+            f"  - {target}: {count} times" for target, count in frequent_targets.most_common(3)
+        )
+        type_lines = "\n".join(
+            f"  - {vtype}: {count} times" for vtype, count in frequent_types.most_common(3)
+        )
+
         safety_text = f"""[Security History]
 Total violations blocked: {len(violations)}
 Recent violations: {len(recent)}
 
 Most frequently attempted:
-{chr(10).join([f'  - {target}: {count} times' for target, count in frequent_targets.most_common(3)])}
+{target_lines}
 
 Violation types:
-{chr(10).join([f'  - {vtype}: {count} times' for vtype, count in frequent_types.most_common(3)])}
+{type_lines}
 
 Be extra careful with these targets!
 """
@@ -1,6 +1,7 @@
 """Usage tracking and rate limiting."""
 
 import json
+import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -53,10 +54,12 @@ class UsageTracker:
         return {"calls": [], "total_calls": 0}
 
     def _save(self):
-        """Persist usage data to file"""
+        """Persist usage data to file (atomic tmp + rename, no fsync stall)"""
         try:
-            with open(self.usage_file, "w", encoding="utf-8") as f:
+            tmp = self.usage_file.with_suffix(self.usage_file.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
                 json.dump(self._data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, self.usage_file)
         except Exception as e:
             print(f"Failed to save usage data: {e}", file=sys.stderr)
 
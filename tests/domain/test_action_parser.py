@@ -1,5 +1,7 @@
 """Tests for domain/action_parser.py — pure Python, no Discord dependency."""
 
+from dataclasses import replace
+
 import pytest
 
 from src.domain.action_parser import (
@@ -13,8 +15,17 @@ from src.domain.action_parser import (
     parse_instagram_body,
     strip_actions,
 )
+from src.domain.alarm import AlarmEntry
 from src.domain.models import ActionBlock
 
+# Prototype entry for format_schedule tests; each case swaps only the
+# scheduling fields via dataclasses.replace.
+_PROTO_ALARM = AlarmEntry(
+    alarm_id="x", schedule_type="daily", hour=9, minute=0,
+    interval_minutes=None, tz="Asia/Seoul", prompt="", channel_id=0,
+    created_by="", created_at="",
+)
+
 
 class TestParseActions:
     def test_single_action(self):
@@ -119,47 +130,30 @@ class TestParseInstagramBody:
 
 class TestFormatSchedule:
     def test_daily(self):
-        from src.domain.alarm import AlarmEntry
-        alarm = AlarmEntry(
-            alarm_id="x", schedule_type="daily", hour=9, minute=0,
-            interval_minutes=None, tz="Asia/Seoul", prompt="", channel_id=0,
-            created_by="", created_at="",
-        )
-        assert format_schedule(alarm) == "매일 09:00"
+        assert format_schedule(_PROTO_ALARM) == "매일 09:00"
 
     def test_weekday(self):
-        from src.domain.alarm import AlarmEntry
-        alarm = AlarmEntry(
-            alarm_id="x", schedule_type="weekday", hour=14, minute=30,
-            interval_minutes=None, tz="Asia/Seoul", prompt="", channel_id=0,
-            created_by="", created_at="",
-        )
+        alarm = replace(_PROTO_ALARM, schedule_type="weekday", hour=14, minute=30)
         assert format_schedule(alarm) == "평일 14:30"
 
     def test_interval_hours(self):
-        from src.domain.alarm import AlarmEntry
-        alarm = AlarmEntry(
-            alarm_id="x", schedule_type="interval", hour=None, minute=None,
-            interval_minutes=120, tz="Asia/Seoul", prompt="", channel_id=0,
-            created_by="", created_at="",
+        alarm = replace(
+            _PROTO_ALARM, schedule_type="interval",
+            hour=None, minute=None, interval_minutes=120,
         )
         assert format_schedule(alarm) == "2시간마다"
 
     def test_interval_minutes(self):
-        from src.domain.alarm import AlarmEntry
-        alarm = AlarmEntry(
-            alarm_id="x", schedule_type="interval", hour=None, minute=None,
-            interval_minutes=30, tz="Asia/Seoul", prompt="", channel_id=0,
-            created_by="", created_at="",
+        alarm = replace(
+            _PROTO_ALARM, schedule_type="interval",
+            hour=None, minute=None, interval_minutes=30,
         )
         assert format_schedule(alarm) == "30분마다"
 
     def test_once_hours(self):
-        from src.domain.alarm import AlarmEntry
-        alarm = AlarmEntry(
-            alarm_id="x", schedule_type="once", hour=None, minute=None,
-            interval_minutes=60, tz="Asia/Seoul", prompt="", channel_id=0,
-            created_by="", created_at="",
+        alarm = replace(
+            _PROTO_ALARM, schedule_type="once",
+            hour=None, minute=None, interval_minutes=60,
         )
         assert format_schedule(alarm) == "1시간 후 1회"
 
@@ -191,7 +191,6 @@ class TestCommands:
 
 
 class TestCancelTasks:
-    @pytest.mark.asyncio
     async def test_cancel_own_tasks(self):
         brain, _, _ = _make_brain()
 
@@ -248,25 +247,21 @@ class TestHistory:
 
 
 class TestActionExecution:
-    @pytest.mark.asyncio
     async def test_unknown_action(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action("UNKNOWN_ACTION", "body")
         assert "알 수 없는 액션" in result
 
-    @pytest.mark.asyncio
     async def test_empty_body_rejected(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action("POST_X", "")
         assert "비어있음" in result
 
-    @pytest.mark.asyncio
     async def test_no_client_for_platform(self):
         brain, _, _ = _make_brain(clients={})
         result = await brain.execute_action("POST_X", "tweet text")
         assert "연결되지 않았음" in result
 
-    @pytest.mark.asyncio
     async def test_set_alarm_missing_schedule(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action(
@@ -274,7 +269,6 @@ class TestActionExecution:
         )
         assert "schedule 필드 누락" in result
 
-    @pytest.mark.asyncio
     async def test_set_alarm_missing_prompt(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action(
@@ -282,7 +276,6 @@ class TestActionExecution:
         )
         assert "prompt 필드 누락" in result
 
-    @pytest.mark.asyncio
     async def test_set_alarm_success(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action(
@@ -294,31 +287,26 @@ class TestActionExecution:
         assert "알람 등록 완료" in result
         assert "매일 09:00" in result
 
-    @pytest.mark.asyncio
     async def test_cancel_alarm_not_found(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action("CANCEL_ALARM", "nonexistent_id")
         assert "찾을 수 없음" in result
 
-    @pytest.mark.asyncio
     async def test_set_alarm_no_context(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action("SET_ALARM", "schedule: daily 09:00\nprompt: hi")
         assert "메시지 컨텍스트 없음" in result
 
-    @pytest.mark.asyncio
     async def test_search_no_client(self):
         brain, _, _ = _make_brain()
         result = await brain.execute_action("SEARCH_NEWS", "query")
         assert "연결되지 않았음" in result
 
-    @pytest.mark.asyncio
     async def test_instagram_empty_caption(self):
         brain, _, _ = _make_brain(clients={"instagram": object()})
         result = await brain.execute_action("POST_INSTAGRAM", "image_url: https://x.com/img.jpg")
         assert "캡션이 비어있음" in result
 
-    @pytest.mark.asyncio
     async def test_instagram_ssrf_prevention(self):
         brain, _, _ = _make_brain(clients={"instagram": object()})
         result = await brain.execute_action(
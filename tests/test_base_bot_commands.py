@@ -59,7 +59,6 @@ def _make_message(content: str, channel_id: int, *, is_bot: bool = False,
 # !clear tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_clear_current_channel_only():
     bot = _make_bot()
     bot._channel_history[OWN_CHANNEL] = [{"role": "user", "text": "hi"}]
@@ -76,7 +75,6 @@ async def test_clear_current_channel_only():
     assert "이 채널" in msg.channel.send.call_args[0][0]
 
 
-@pytest.mark.asyncio
 async def test_clear_all_channels():
     bot = _make_bot()
     bot._channel_history[OWN_CHANNEL] = [{"role": "user", "text": "hi"}]
@@ -94,7 +92,6 @@ async def test_clear_all_channels():
 # !cancel tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_cancel_active_task():
     """!cancel should cancel a running task; _respond sends the cancellation message."""
     executor = MagicMock()
@@ -114,7 +111,6 @@ async def test_cancel_active_task():
     msg.channel.send.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_cancel_no_active_task_own_channel():
     """!cancel in 1:1 channel with no active task → inform user."""
     bot = _make_bot()
@@ -125,7 +121,6 @@ async def test_cancel_no_active_task_own_channel():
     assert "취소할 작업이 없음" in msg.channel.send.call_args[0][0]
 
 
-@pytest.mark.asyncio
 async def test_cancel_no_active_task_team_channel_silent():
     """!cancel in team channel with no active task → silence (no 5-bot noise)."""
     bot = _make_bot()
@@ -139,7 +134,6 @@ async def test_cancel_no_active_task_team_channel_silent():
 # !help test
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_help_in_own_channel():
     bot = _make_bot()
     msg = _make_message("!help", OWN_CHANNEL)
@@ -156,7 +150,6 @@ async def test_help_in_own_channel():
 # Bot-sent commands ignored
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_bot_author_commands_ignored():
     """Commands from other bots should be ignored entirely."""
     bot = _make_bot()
@@ -170,7 +163,6 @@ async def test_bot_author_commands_ignored():
 # !clear / !help require mention in team channel
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_clear_team_channel_without_mention_silent():
     """!clear in team channel without mention → clears silently (no message)."""
     bot = _make_bot()
@@ -184,7 +176,6 @@ async def test_clear_team_channel_without_mention_silent():
     msg.channel.send.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_help_team_channel_without_mention_ignored():
     """!help in team channel without mention → non-TeamLead bots stay silent."""
     bot = _make_bot()  # bot_name="TestBot", not TeamLead
@@ -198,7 +189,6 @@ async def test_help_team_channel_without_mention_ignored():
 # Race condition: second message must not lose its task reference
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_concurrent_tasks_no_orphan():
     """When task2 overwrites task1 in _active_tasks, task1's finally must not evict task2."""
     executor = MagicMock()
@@ -226,7 +216,6 @@ async def test_concurrent_tasks_no_orphan():
 # Cancel suppression tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_cancel_sets_suppress_flag():
     """!cancel should set _suppress_bot_replies flag."""
     bot = _make_bot()
@@ -241,7 +230,6 @@ async def test_cancel_sets_suppress_flag():
     assert bot._suppress_bot_replies is True
 
 
-@pytest.mark.asyncio
 async def test_cancel_all_sets_suppress_flag():
     """!cancel all should set _suppress_bot_replies flag."""
     bot = _make_bot()
@@ -251,7 +239,6 @@ async def test_cancel_all_sets_suppress_flag():
     assert bot._suppress_bot_replies is True
 
 
-@pytest.mark.asyncio
 async def test_suppress_cleared_on_human_message():
     """Human message should clear _suppress_bot_replies flag."""
     bot = _make_bot(executor=MagicMock())
@@ -265,7 +252,6 @@ async def test_suppress_cleared_on_human_message():
     assert bot._suppress_bot_replies is False
 
 
-@pytest.mark.asyncio
 async def test_bot_message_suppressed_after_cancel():
     """Bot messages should be suppressed when _suppress_bot_replies is True."""
     bot = _make_bot()
@@ -37,6 +37,22 @@ class TestSimpleMemory:
             assert "id" in decisions[0]
             assert "timestamp" in decisions[0]
 
+    def test_add_decisions_batch(self):
+        """Test adding several decisions in one call"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            memory = SimpleMemory(memory_dir=tmpdir)
+
+            memory.add_decisions([
+                {"action": "notify", "message": "First"},
+                {"action": "skip", "message": "Second"},
+            ])
+            decisions = memory.load_decisions()
+
+            assert len(decisions) == 2
+            assert decisions[0]["message"] == "First"
+            assert decisions[1]["action"] == "skip"
+            assert all("id" in d and "timestamp" in d for d in decisions)
+
     def test_duplicate_detection(self):
         """Test duplicate message detection"""
         with tempfile.TemporaryDirectory() as tmpdir:
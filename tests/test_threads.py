@@ -82,6 +82,8 @@ def _mock_aiohttp_session(responses):
             pass
 
     class FakeSession:
+        closed = False
+
         def post(self, url, **kwargs):
             nonlocal call_idx
             resp = FakeResponse(responses[call_idx])
@@ -98,7 +100,6 @@ def _mock_aiohttp_session(responses):
 
 
 class TestPost:
-    @pytest.mark.asyncio
     async def test_post_success(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"id": "container_1"},  # create container
@@ -111,7 +112,6 @@ class TestPost:
         assert result.post_id == "post_1"
         assert result.text == "Hello Threads"
 
-    @pytest.mark.asyncio
     async def test_post_container_error(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"error": {"message": "Invalid token"}},
@@ -122,7 +122,6 @@ class TestPost:
         assert result.success is False
         assert "Invalid token" in result.error
 
-    @pytest.mark.asyncio
     async def test_post_publish_error(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"id": "container_1"},
@@ -134,7 +133,6 @@ class TestPost:
         assert result.success is False
         assert "Publish failed" in result.error
 
-    @pytest.mark.asyncio
     async def test_post_truncates(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"id": "c1"},
@@ -148,7 +146,6 @@ class TestPost:
 
 
 class TestReply:
-    @pytest.mark.asyncio
     async def test_reply_success(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"id": "container_r"},
@@ -160,7 +157,6 @@ class TestReply:
         assert result.success is True
         assert result.post_id == "reply_1"
 
-    @pytest.mark.asyncio
     async def test_reply_failure(self, threads_configured):
         mock_session = _mock_aiohttp_session([
             {"error": {"message": "Not found"}},
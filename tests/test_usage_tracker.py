@@ -20,11 +20,9 @@ def tracker(tmp_path):
 
 
 @pytest.fixture(autouse=True)
-def reset_config():
-    """Reset CONFIG usage_limits before each test"""
-    original = CONFIG["usage_limits"].copy()
-    yield
-    CONFIG["usage_limits"] = original
+def reset_config(monkeypatch):
+    """Give each test a throwaway copy of usage_limits; monkeypatch restores it"""
+    monkeypatch.setitem(CONFIG, "usage_limits", CONFIG["usage_limits"].copy())
 
 
 class TestDailyLimit:
@@ -78,7 +78,6 @@ class TestTruncateText:
 
 
 class TestPost:
-    @pytest.mark.asyncio
     async def test_post_success(self, x_configured):
         client = XClient()
         mock_tweepy = MagicMock()
@@ -93,7 +92,6 @@ class TestPost:
         assert result.text == "Hello world"
         assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_post_failure(self, x_configured):
         client = XClient()
         mock_tweepy = MagicMock()
@@ -105,7 +103,6 @@ class TestPost:
         assert result.post_id is None
         assert result.error == "API error"
 
-    @pytest.mark.asyncio
     async def test_post_truncates(self, x_configured):
         client = XClient()
         mock_tweepy = MagicMock()
@@ -121,7 +118,6 @@ class TestPost:
 
 
 class TestReply:
-    @pytest.mark.asyncio
     async def test_reply_success(self, x_configured):
         client = XClient()
         mock_tweepy = MagicMock()
@@ -137,7 +133,6 @@ class TestReply:
             text="Reply text", in_reply_to_tweet_id="12345"
         )
 
-    @pytest.mark.asyncio
     async def test_reply_failure(self, x_configured):
         client = XClient()
         mock_tweepy = MagicMock()